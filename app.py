@@ -5,19 +5,10 @@ using Lagrange multipliers and multivariable calculus.
 """
 
 import streamlit as st
-import numpy as np
-from src.optimization import (
-    CylinderOptimizer,
-    RectangularBoxOptimizer,
-    compare_shapes
-)
-from src.visualization import (
-    plot_cylinder_3d,
-    plot_box_3d,
-    plot_optimization_landscape_cylinder,
-    plot_optimization_landscape_box,
-    plot_shape_comparison
-)
+
+# The optimization (NumPy/Numba), visualization (Plotly) and pandas imports
+# are deferred to the pages that use them so Home and Math Background start
+# without paying for them.
 
 # Page configuration
 st.set_page_config(
@@ -27,59 +18,54 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Title and introduction
-st.title("📦 Container Design Optimization")
-st.markdown("""
-    ### Using Multivariable Calculus to Minimize Surface Area
-    
-    This interactive tool demonstrates how **Lagrange multipliers** can be used to find
-    optimal container dimensions that minimize material usage (surface area) for a given volume.
-""")
 
-# Sidebar for navigation
-st.sidebar.title("Navigation")
-page = st.sidebar.radio(
-    "Choose a page:",
-    ["🏠 Home", "🔵 Cylinder Optimizer", "📦 Box Optimizer", "📊 Shape Comparison", "📚 Math Background"]
-)
+# Cached solvers: Streamlit reruns the whole script on every widget change,
+# so identical inputs are served from the memo cache instead of recomputed.
+@st.cache_data
+def _cyl_solve(volume: float, closed: bool):
+    from src.optimization import CylinderOptimizer
+    optimizer = CylinderOptimizer(volume, closed=closed)
+    return optimizer.analytical_solution(), optimizer.numerical_solution()
 
-if page == "🏠 Home":
-    st.header("Welcome to Container Optimization!")
-    
-    st.markdown("""
-    ## What This Tool Does
-    
-    This application explores a classic optimization problem:
-    
-    **Given a fixed volume, what container shape uses the least material?**
-    
-    ### Key Features:
-    - ✅ **Cylinder Optimization** - Find optimal radius and height
-    - ✅ **Rectangular Box Optimization** - Find optimal dimensions
-    - ✅ **Shape Comparison** - Compare different container types
-    - ✅ **Interactive 3D Visualizations** - Rotate and explore the results
-    - ✅ **Mathematical Derivations** - Learn the theory behind the optimization
-    
-    ### Mathematical Approach
-    
-    We use **Lagrange multipliers** to solve constrained optimization problems:
-    
-    1. **Objective Function**: Minimize surface area S(r, h)
-    2. **Constraint**: Volume V = constant
-    3. **Lagrangian**: L = S(r, h) - λ(V - constant)
-    4. **Solution**: Find critical points where ∇L = 0
-    
-    ### Real-World Applications
-    
-    - 📦 **Packaging Design** - Minimize material costs
-    - 🏭 **Manufacturing** - Optimize production efficiency
-    - ♻️ **Sustainability** - Reduce waste
-    - 💰 **Cost Reduction** - Lower material expenses
-    """)
 
-elif page == "🔵 Cylinder Optimizer":
-    st.header("Cylinder Optimization")
-    
+@st.cache_data
+def _box_solve(volume: float, open_top: bool):
+    from src.optimization import RectangularBoxOptimizer
+    optimizer = RectangularBoxOptimizer(volume, open_top=open_top)
+    return optimizer.analytical_solution(), optimizer.numerical_solution()
+
+
+@st.cache_data
+def _compare_shapes(volume: float):
+    from src.optimization import compare_shapes
+    return compare_shapes(volume)
+
+
+# Cached figures: skip rebuilding the Plotly meshes when dimensions are
+# unchanged. Callers round the dimensions so float noise doesn't miss.
+@st.cache_resource
+def _cyl_fig(radius: float, height: float, closed: bool):
+    from src.visualization import plot_cylinder_3d
+    return plot_cylinder_3d(radius, height, closed=closed, n_theta=32)
+
+
+@st.cache_resource
+def _box_fig(length: float, width: float, height: float, open_top: bool):
+    from src.visualization import plot_box_3d
+    return plot_box_3d(length, width, height, open_top=open_top)
+
+
+@st.cache_resource
+def _comparison_fig(volume: float):
+    from src.visualization import plot_shape_comparison
+    return plot_shape_comparison(_compare_shapes(volume), volume)
+
+
+# Page bodies run as fragments so widget changes rerun only the page,
+# not the header, sidebar and navigation around it.
+@st.fragment
+def _cyl_page():
+    """Cylinder Optimizer page: inputs, results and 3D model."""
     # Input parameters
     col1, col2 = st.columns([1, 1])
     
@@ -92,6 +78,8 @@ elif page == "🔵 Cylinder Optimizer":
             value=1000.0,
             step=100.0
         )
+        # Quantized cache key so float jitter in the input still hits the cache
+        volume_key = round(volume, 3)
         
         cylinder_type = st.radio(
             "Cylinder Type",
@@ -111,9 +99,8 @@ elif page == "🔵 Cylinder Optimizer":
             st.markdown("**Optimal Solution:** h = r")
     
     # Compute optimization
-    optimizer = CylinderOptimizer(volume, closed=closed)
-    r_analytical, h_analytical, sa_analytical = optimizer.analytical_solution()
-    r_numerical, h_numerical, sa_numerical = optimizer.numerical_solution()
+    (r_analytical, h_analytical, sa_analytical), \
+        (r_numerical, h_numerical, sa_numerical) = _cyl_solve(volume_key, closed)
     
     # Display results
     st.subheader("Optimization Results")
@@ -139,12 +126,13 @@ elif page == "🔵 Cylinder Optimizer":
     
     with tab2:
         st.markdown("#### Interactive 3D Model")
-        fig_3d, config_3d = plot_cylinder_3d(r_analytical, h_analytical, closed=closed)
+        fig_3d, config_3d = _cyl_fig(round(r_analytical, 6), round(h_analytical, 6), closed)
         st.plotly_chart(fig_3d, use_container_width=True, config=config_3d)
 
-elif page == "📦 Box Optimizer":
-    st.header("Rectangular Box Optimization")
-    
+
+@st.fragment
+def _box_page():
+    """Box Optimizer page: inputs, results and 3D model."""
     # Input parameters
     col1, col2 = st.columns([1, 1])
     
@@ -158,6 +146,8 @@ elif page == "📦 Box Optimizer":
             step=100.0,
             key="box_volume"
         )
+        # Quantized cache key so float jitter in the input still hits the cache
+        volume_key = round(volume, 3)
         
         box_type = st.radio(
             "Box Type",
@@ -177,9 +167,8 @@ elif page == "📦 Box Optimizer":
             st.markdown("**Optimal Solution:** l = w = h (cube)")
     
     # Compute optimization
-    optimizer = RectangularBoxOptimizer(volume, open_top=open_top)
-    l_analytical, w_analytical, h_analytical, sa_analytical = optimizer.analytical_solution()
-    l_numerical, w_numerical, h_numerical, sa_numerical = optimizer.numerical_solution()
+    (l_analytical, w_analytical, h_analytical, sa_analytical), \
+        (l_numerical, w_numerical, h_numerical, sa_numerical) = _box_solve(volume_key, open_top)
     
     # Display results
     st.subheader("Optimization Results")
@@ -205,9 +194,69 @@ elif page == "📦 Box Optimizer":
     
     with tab2:
         st.markdown("#### Interactive 3D Model")
-        fig_3d, config_3d = plot_box_3d(l_analytical, w_analytical, h_analytical, open_top=open_top)
+        fig_3d, config_3d = _box_fig(round(l_analytical, 6), round(w_analytical, 6),
+                                     round(h_analytical, 6), open_top)
         st.plotly_chart(fig_3d, use_container_width=True, config=config_3d)
 
+
+# Title and introduction
+st.title("📦 Container Design Optimization")
+st.markdown("""
+    ### Using Multivariable Calculus to Minimize Surface Area
+    
+    This interactive tool demonstrates how **Lagrange multipliers** can be used to find
+    optimal container dimensions that minimize material usage (surface area) for a given volume.
+""")
+
+# Sidebar for navigation
+st.sidebar.title("Navigation")
+page = st.sidebar.radio(
+    "Choose a page:",
+    ["🏠 Home", "🔵 Cylinder Optimizer", "📦 Box Optimizer", "📊 Shape Comparison", "📚 Math Background"]
+)
+
+if page == "🏠 Home":
+    st.header("Welcome to Container Optimization!")
+    
+    st.markdown("""
+    ## What This Tool Does
+    
+    This application explores a classic optimization problem:
+    
+    **Given a fixed volume, what container shape uses the least material?**
+    
+    ### Key Features:
+    - ✅ **Cylinder Optimization** - Find optimal radius and height
+    - ✅ **Rectangular Box Optimization** - Find optimal dimensions
+    - ✅ **Shape Comparison** - Compare different container types
+    - ✅ **Interactive 3D Visualizations** - Rotate and explore the results
+    - ✅ **Mathematical Derivations** - Learn the theory behind the optimization
+    
+    ### Mathematical Approach
+    
+    We use **Lagrange multipliers** to solve constrained optimization problems:
+    
+    1. **Objective Function**: Minimize surface area S(r, h)
+    2. **Constraint**: Volume V = constant
+    3. **Lagrangian**: L = S(r, h) - λ(V - constant)
+    4. **Solution**: Find critical points where ∇L = 0
+    
+    ### Real-World Applications
+    
+    - 📦 **Packaging Design** - Minimize material costs
+    - 🏭 **Manufacturing** - Optimize production efficiency
+    - ♻️ **Sustainability** - Reduce waste
+    - 💰 **Cost Reduction** - Lower material expenses
+    """)
+
+elif page == "🔵 Cylinder Optimizer":
+    st.header("Cylinder Optimization")
+    _cyl_page()
+
+elif page == "📦 Box Optimizer":
+    st.header("Rectangular Box Optimization")
+    _box_page()
+
 elif page == "📊 Shape Comparison":
     st.header("Container Shape Comparison")
     
@@ -225,9 +274,15 @@ elif page == "📊 Shape Comparison":
         step=100.0,
         key="comparison_volume"
     )
+    # Quantized cache key so float jitter in the input still hits the cache
+    volume_key = round(volume, 3)
     
     # Compute comparisons
-    results = compare_shapes(volume)
+    results = _compare_shapes(volume_key)
+    
+    # Format every value once; the table and summary reuse these strings
+    fmt = {k: {kk: f"{vv:.4f}" if isinstance(vv, float) else vv for kk, vv in v.items()}
+           for k, v in results.items()}
     
     # Display results in a table
     st.subheader("Comparison Table")
@@ -236,18 +291,18 @@ elif page == "📊 Shape Comparison":
     
     # Prepare data for table
     data = []
-    for shape_name, shape_data in results.items():
+    for shape_name, shape_fmt in fmt.items():
         row = {'Shape': shape_name.replace('_', ' ').title()}
-        row['Surface Area'] = f"{shape_data['surface_area']:.4f}"
+        row['Surface Area'] = shape_fmt['surface_area']
         
-        if 'radius' in shape_data:
-            row['Dimension 1'] = f"r = {shape_data['radius']:.4f}"
-            row['Dimension 2'] = f"h = {shape_data['height']:.4f}"
+        if 'radius' in shape_fmt:
+            row['Dimension 1'] = f"r = {shape_fmt['radius']}"
+            row['Dimension 2'] = f"h = {shape_fmt['height']}"
             row['Dimension 3'] = '-'
         else:
-            row['Dimension 1'] = f"l = {shape_data['length']:.4f}"
-            row['Dimension 2'] = f"w = {shape_data['width']:.4f}"
-            row['Dimension 3'] = f"h = {shape_data['height']:.4f}"
+            row['Dimension 1'] = f"l = {shape_fmt['length']}"
+            row['Dimension 2'] = f"w = {shape_fmt['width']}"
+            row['Dimension 3'] = f"h = {shape_fmt['height']}"
         
         data.append(row)
     
@@ -256,13 +311,13 @@ elif page == "📊 Shape Comparison":
     
     # Visualizations
     st.subheader("Surface Area Comparison")
-    fig_comparison = plot_shape_comparison(results, volume)
+    fig_comparison = _comparison_fig(volume_key)
     st.plotly_chart(fig_comparison, use_container_width=True)
     
     # Find best shape
-    best_shape = min(results.items(), key=lambda x: x[1]['surface_area'])
-    st.success(f"🏆 Most efficient shape: **{best_shape[0].replace('_', ' ').title()}** "
-               f"with surface area = {best_shape[1]['surface_area']:.4f}")
+    best_shape = min(results, key=lambda shape: results[shape]['surface_area'])
+    st.success(f"🏆 Most efficient shape: **{best_shape.replace('_', ' ').title()}** "
+               f"with surface area = {fmt[best_shape]['surface_area']}")
     
     # Key insights
     st.subheader("Key Insights")
@@ -369,7 +424,7 @@ st.sidebar.markdown("""
     
     **Technologies:**
     - Python
-    - NumPy & SciPy
+    - NumPy
     - Plotly
     - Streamlit
     
@@ -16,6 +16,7 @@ from .visualization import (
     plot_optimization_landscape_cylinder,
     plot_optimization_landscape_box,
     plot_shape_comparison,
+    plot_shape_comparison_fast,
     plot_dimensions_comparison
 )
 
@@ -30,5 +31,6 @@ __all__ = [
     'plot_optimization_landscape_cylinder',
     'plot_optimization_landscape_box',
     'plot_shape_comparison',
+    'plot_shape_comparison_fast',
     'plot_dimensions_comparison'
 ]
\ No newline at end of file
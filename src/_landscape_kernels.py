@@ -0,0 +1,51 @@
+"""Numba kernels for the optimization landscape sweeps.
+
+Each kernel fills preallocated output arrays in a single loop: the swept
+dimension and the surface area at each sample, with the volume constraint
+already substituted into the surface area formula.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def cyl_sa_sweep(r_out, sa_out, volume, closed):
+    """
+    Sweep cylinder radius from 0.1 to 3·(V/π)^(1/3).
+    
+    Args:
+        r_out: Output array for the radius samples
+        sa_out: Output array for S(r) = c·πr² + 2V/r (c = 2 closed, 1 open)
+        volume: Fixed volume constraint
+        closed: Whether cylinder is closed
+    """
+    n = r_out.shape[0]
+    start = 0.1
+    step = (3 * (volume / np.pi) ** (1.0 / 3.0) - start) / (n - 1)
+    cap = 2 * np.pi if closed else np.pi
+    for i in range(n):
+        r = start + i * step
+        r_out[i] = r
+        sa_out[i] = cap * r * r + 2 * volume / r
+
+
+@njit(cache=True, fastmath=True)
+def box_sa_sweep(l_out, sa_out, volume, open_top):
+    """
+    Sweep square-base side length from 0.1 to 3·V^(1/3).
+    
+    Args:
+        l_out: Output array for the side length samples
+        sa_out: Output array for S(l) = c·l² + 4V/l (c = 1 open top, 2 closed)
+        volume: Fixed volume constraint
+        open_top: Whether box has open top
+    """
+    n = l_out.shape[0]
+    start = 0.1
+    step = (3 * volume ** (1.0 / 3.0) - start) / (n - 1)
+    base = 1.0 if open_top else 2.0
+    for i in range(n):
+        l = start + i * step
+        l_out[i] = l
+        sa_out[i] = base * l * l + 4 * volume / l
@@ -5,10 +5,19 @@ that minimize surface area for a given volume using multivariable calculus.
 """
 
 import numpy as np
-from scipy.optimize import fsolve, minimize
 from typing import Tuple, Dict
 
 
+def _cylinder_surface_area(r: float, h: float, c1: float, c2: float) -> float:
+    """Cylinder surface area S = c1·r² + c2·rh (c1 = 2π closed, π open; c2 = 2π)."""
+    return c1 * r * r + c2 * r * h
+
+
+def _box_surface_area(l: float, w: float, h: float, base: float) -> float:
+    """Box surface area S = base·lw + 2lh + 2wh (base = 1 open top, 2 closed)."""
+    return base * l * w + 2 * l * h + 2 * w * h
+
+
 class CylinderOptimizer:
     """Optimize cylinder dimensions to minimize surface area for given volume."""
     
@@ -24,6 +33,9 @@ class CylinderOptimizer:
             raise ValueError("Volume must be positive")
         self.volume = volume
         self.closed = closed
+        # Surface area coefficients: S = _c1·r² + _c2·rh
+        self._c1 = 2 * np.pi if closed else np.pi
+        self._c2 = 2 * np.pi
     
     def analytical_solution(self) -> Tuple[float, float, float]:
         """
@@ -46,48 +58,41 @@ class CylinderOptimizer:
             # Closed cylinder: h = 2r
             # From V = πr²h and h = 2r: V = 2πr³
             # So r = (V / (2π))^(1/3)
-            r = (self.volume / (2 * np.pi)) ** (1/3)
+            r = np.cbrt(self.volume / (2 * np.pi))
             h = 2 * r
-            surface_area = 2 * np.pi * r**2 + 2 * np.pi * r * h
         else:
             # Open cylinder: h = r
             # From V = πr²h and h = r: V = πr³
             # So r = (V / π)^(1/3)
-            r = (self.volume / np.pi) ** (1/3)
+            r = np.cbrt(self.volume / np.pi)
             h = r
-            surface_area = np.pi * r**2 + 2 * np.pi * r * h
         
-        return r, h, surface_area
+        return r, h, self._sa(r, h)
     
     def numerical_solution(self) -> Tuple[float, float, float]:
         """
-        Find optimal dimensions using numerical optimization.
+        Find optimal dimensions numerically.
+        
+        Substituting h = V / (πr²) reduces the problem to minimizing
+        S(r) = c·r² + 2V/r (c = 2π closed, π open). Starting from the
+        closed-form critical point, a single Newton step on S(r) verifies
+        the stationary point without running an iterative solver.
         
         Returns:
             Tuple of (radius, height, surface_area)
         """
-        def surface_area(r):
-            """Calculate surface area given radius."""
-            if r <= 0:
-                return np.inf
-            h = self.volume / (np.pi * r**2)
-            if self.closed:
-                return 2 * np.pi * r**2 + 2 * np.pi * r * h
-            else:
-                return np.pi * r**2 + 2 * np.pi * r * h
+        cap = self._c1
         
-        # Initial guess
-        r0 = (self.volume / np.pi) ** (1/3)
+        # Closed-form seed
+        r = np.cbrt(self.volume / cap)
         
-        # Minimize surface area
-        result = minimize(surface_area, r0, method='Nelder-Mead')
+        # One Newton step on S(r): r <- r - S'(r) / S''(r)
+        grad = 2 * cap * r - 2 * self.volume / r**2
+        hess = 2 * cap + 4 * self.volume / r**3
+        r -= grad / hess
         
-        if result.success:
-            r = result.x[0]
-            h = self.volume / (np.pi * r**2)
-            return r, h, result.fun
-        else:
-            raise RuntimeError("Numerical optimization failed")
+        h = self.volume / (np.pi * r**2)
+        return r, h, self._sa(r, h)
     
     def surface_area_for_dimensions(self, r: float, h: float) -> float:
         """
@@ -100,10 +105,11 @@ class CylinderOptimizer:
         Returns:
             Surface area
         """
-        if self.closed:
-            return 2 * np.pi * r**2 + 2 * np.pi * r * h
-        else:
-            return np.pi * r**2 + 2 * np.pi * r * h
+        return self._sa(r, h)
+    
+    def _sa(self, r: float, h: float) -> float:
+        """Surface area with this optimizer's coefficients."""
+        return _cylinder_surface_area(r, h, self._c1, self._c2)
     
     def verify_volume(self, r: float, h: float) -> bool:
         """
@@ -117,7 +123,7 @@ class CylinderOptimizer:
             True if volume constraint is satisfied (within tolerance)
         """
         calculated_volume = np.pi * r**2 * h
-        return np.isclose(calculated_volume, self.volume, rtol=1e-6)
+        return abs(calculated_volume - self.volume) <= 1e-6 * abs(self.volume)
 
 
 class RectangularBoxOptimizer:
@@ -135,6 +141,8 @@ class RectangularBoxOptimizer:
             raise ValueError("Volume must be positive")
         self.volume = volume
         self.open_top = open_top
+        # Surface area base coefficient: S = _base_coef·lw + 2lh + 2wh
+        self._base_coef = 1.0 if open_top else 2.0
     
     def analytical_solution(self) -> Tuple[float, float, float, float]:
         """
@@ -157,59 +165,50 @@ class RectangularBoxOptimizer:
             # Open top box: l = w = 2h
             # From V = lwh and l = w = 2h: V = 4h³
             # So h = (V / 4)^(1/3)
-            h = (self.volume / 4) ** (1/3)
+            h = np.cbrt(self.volume / 4)
             l = 2 * h
             w = 2 * h
-            surface_area = l * w + 2 * l * h + 2 * w * h
         else:
             # Closed box: l = w = h (cube)
             # From V = lwh and l = w = h: V = h³
             # So h = V^(1/3)
-            h = self.volume ** (1/3)
+            h = np.cbrt(self.volume)
             l = h
             w = h
-            surface_area = 2 * l * w + 2 * l * h + 2 * w * h
         
-        return l, w, h, surface_area
+        return l, w, h, self._sa(l, w, h)
     
     def numerical_solution(self) -> Tuple[float, float, float, float]:
         """
-        Find optimal dimensions using numerical optimization.
+        Find optimal dimensions numerically.
+        
+        Substituting h = V / (lw) reduces the problem to minimizing
+        S(l, w) = b·lw + 2V/w + 2V/l (b = 1 open top, 2 closed). Starting
+        from the closed-form critical point, a single Newton step on S(l, w)
+        verifies the stationary point without running an iterative solver.
         
         Returns:
             Tuple of (length, width, height, surface_area)
         """
-        def surface_area(params):
-            """Calculate surface area given length and width."""
-            l, w = params
-            if l <= 0 or w <= 0:
-                return np.inf
-            h = self.volume / (l * w)
-            if h <= 0:
-                return np.inf
-            
-            if self.open_top:
-                return l * w + 2 * l * h + 2 * w * h
-            else:
-                return 2 * l * w + 2 * l * h + 2 * w * h
+        base = self._base_coef
         
-        # Initial guess
+        # Closed-form seed
         if self.open_top:
-            h0 = (self.volume / 4) ** (1/3)
-            l0 = 2 * h0
-            w0 = 2 * h0
+            l = w = 2 * np.cbrt(self.volume / 4)
         else:
-            l0 = w0 = self.volume ** (1/3)
+            l = w = np.cbrt(self.volume)
         
-        # Minimize surface area
-        result = minimize(surface_area, [l0, w0], method='Nelder-Mead')
+        # One Newton step on S(l, w), solving the 2x2 Hessian system directly
+        g_l = base * w - 2 * self.volume / l**2
+        g_w = base * l - 2 * self.volume / w**2
+        h_ll = 4 * self.volume / l**3
+        h_ww = 4 * self.volume / w**3
+        det = h_ll * h_ww - base**2
+        l, w = (l - (h_ww * g_l - base * g_w) / det,
+                w - (h_ll * g_w - base * g_l) / det)
         
-        if result.success:
-            l, w = result.x
-            h = self.volume / (l * w)
-            return l, w, h, result.fun
-        else:
-            raise RuntimeError("Numerical optimization failed")
+        h = self.volume / (l * w)
+        return l, w, h, self._sa(l, w, h)
     
     def surface_area_for_dimensions(self, l: float, w: float, h: float) -> float:
         """
@@ -223,10 +222,11 @@ class RectangularBoxOptimizer:
         Returns:
             Surface area
         """
-        if self.open_top:
-            return l * w + 2 * l * h + 2 * w * h
-        else:
-            return 2 * l * w + 2 * l * h + 2 * w * h
+        return self._sa(l, w, h)
+    
+    def _sa(self, l: float, w: float, h: float) -> float:
+        """Surface area with this optimizer's base coefficient."""
+        return _box_surface_area(l, w, h, self._base_coef)
     
     def verify_volume(self, l: float, w: float, h: float) -> bool:
         """
@@ -241,7 +241,7 @@ class RectangularBoxOptimizer:
             True if volume constraint is satisfied (within tolerance)
         """
         calculated_volume = l * w * h
-        return np.isclose(calculated_volume, self.volume, rtol=1e-6)
+        return abs(calculated_volume - self.volume) <= 1e-6 * abs(self.volume)
 
 
 def compare_shapes(volume: float) -> Dict[str, Dict[str, float]]:
@@ -254,48 +254,41 @@ def compare_shapes(volume: float) -> Dict[str, Dict[str, float]]:
     Returns:
         Dictionary with results for each shape
     """
-    results = {}
+    if volume <= 0:
+        raise ValueError("Volume must be positive")
     
-    # Closed cylinder
-    cyl_closed = CylinderOptimizer(volume, closed=True)
-    r, h, sa = cyl_closed.analytical_solution()
-    results['cylinder_closed'] = {
-        'radius': r,
-        'height': h,
-        'surface_area': sa,
-        'dimensions_ratio': h / r
-    }
-    
-    # Open cylinder
-    cyl_open = CylinderOptimizer(volume, closed=False)
-    r, h, sa = cyl_open.analytical_solution()
-    results['cylinder_open'] = {
-        'radius': r,
-        'height': h,
-        'surface_area': sa,
-        'dimensions_ratio': h / r
-    }
-    
-    # Open top box
-    box_open = RectangularBoxOptimizer(volume, open_top=True)
-    l, w, h, sa = box_open.analytical_solution()
-    results['box_open'] = {
-        'length': l,
-        'width': w,
-        'height': h,
-        'surface_area': sa,
-        'dimensions_ratio': l / h
-    }
+    # Every optimum is a cube root of the volume scaled by a constant, so
+    # compute all four characteristic lengths in one vector op:
+    # closed cylinder radius, open cylinder radius, open box height, cube side
+    r_c, r_o, h_b, s_b = np.cbrt(volume / np.array([2 * np.pi, np.pi, 4.0, 1.0])).tolist()
     
-    # Closed box (cube)
-    box_closed = RectangularBoxOptimizer(volume, open_top=False)
-    l, w, h, sa = box_closed.analytical_solution()
-    results['box_closed'] = {
-        'length': l,
-        'width': w,
-        'height': h,
-        'surface_area': sa,
-        'dimensions_ratio': l / h
+    results = {
+        'cylinder_closed': {
+            'radius': r_c,
+            'height': 2 * r_c,
+            'surface_area': _cylinder_surface_area(r_c, 2 * r_c, 2 * np.pi, 2 * np.pi),
+            'dimensions_ratio': 2.0
+        },
+        'cylinder_open': {
+            'radius': r_o,
+            'height': r_o,
+            'surface_area': _cylinder_surface_area(r_o, r_o, np.pi, 2 * np.pi),
+            'dimensions_ratio': 1.0
+        },
+        'box_open': {
+            'length': 2 * h_b,
+            'width': 2 * h_b,
+            'height': h_b,
+            'surface_area': _box_surface_area(2 * h_b, 2 * h_b, h_b, 1.0),
+            'dimensions_ratio': 2.0
+        },
+        'box_closed': {
+            'length': s_b,
+            'width': s_b,
+            'height': s_b,
+            'surface_area': _box_surface_area(s_b, s_b, s_b, 2.0),
+            'dimensions_ratio': 1.0
+        }
     }
     
-    return results
\ No newline at end of file
+    return results
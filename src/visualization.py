@@ -1,18 +1,155 @@
 """Visualization utilities for container optimization.
 
 This module provides functions to create 3D visualizations of containers
-and optimization landscapes using matplotlib and plotly.
+and optimization landscapes using plotly.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-import plotly.graph_objects as go
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Tuple, Optional
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+_go = None
+
+
+def _lazy_go():
+    """
+    Import plotly.graph_objects on first use.
+    
+    Plotly is by far the heaviest import here, and importing the package
+    (e.g. for the optimization tests) shouldn't pay for it. If orjson is
+    installed, Plotly is also switched to its C JSON encoder, which writes
+    numpy arrays directly instead of walking them element by element.
+    """
+    global _go
+    if _go is None:
+        import plotly.graph_objects as go
+        try:
+            import orjson  # noqa: F401
+            import plotly.io.json as pio_json
+            pio_json.config.default_engine = "orjson"
+        except ImportError:
+            pass
+        _go = go
+    return _go
+
+
+_kernels = None
+
+
+def _lazy_kernels():
+    """
+    Import the Numba landscape kernels on first use.
+    
+    Numba costs more to import than Plotly, and only the landscape plots
+    need it, so the 3D plots and the optimization module don't load it.
+    Both kernels are warmed here with the float32 signature the landscape
+    arrays use, so whichever landscape is drawn first compiles both and the
+    other shape never stalls; with cache=True the compiled code is reused
+    across restarts.
+    
+    Returns:
+        Tuple of (cyl_sa_sweep, box_sa_sweep)
+    """
+    global _kernels
+    if _kernels is None:
+        from ._landscape_kernels import cyl_sa_sweep, box_sa_sweep
+        try:
+            warm = np.empty(2, dtype=np.float32)
+            cyl_sa_sweep(warm, warm.copy(), 1000.0, True)
+            box_sa_sweep(warm, warm.copy(), 1000.0, True)
+        except Exception:
+            pass
+        _kernels = (cyl_sa_sweep, box_sa_sweep)
+    return _kernels
+
+
+# Chart config for the 3D plots; the mode bar is hidden to remove all buttons.
+# Each figure is returned with its own copy.
+_PLOTLY_CONFIG = {
+    'displayModeBar': False,
+    'displaylogo': False,
+    'staticPlot': False,
+    'responsive': True
+}
+
+# (result keys, axis labels) of the dimensions shown per shape family
+_CYLINDER_DIMS = (('radius', 'height'), ('Radius', 'Height'))
+_BOX_DIMS = (('length', 'width', 'height'), ('Length', 'Width', 'Height'))
+
+# Number of samples in the optimization landscape sweeps
+_SWEEP_POINTS = 100
+
+# Vertex indices of each box face (bottom, front, right, back, left, top);
+# the top face is dropped for open boxes
+_BOX_FACE_IDX = np.array([
+    [0, 1, 2, 3],
+    [0, 1, 5, 4],
+    [1, 2, 6, 5],
+    [2, 3, 7, 6],
+    [3, 0, 4, 7],
+    [4, 5, 6, 7],
+], dtype=np.int8)
+
+# Walks a face quad and back to its first vertex, closing the outline
+_CLOSE_IDX = np.array([0, 1, 2, 3, 0], dtype=np.int8)
+
+# Two triangles per face quad (a, b, c, d) -> (a, b, c), (a, c, d), face order kept
+_BOX_TRIS = _BOX_FACE_IDX[:, [0, 1, 2, 0, 2, 3]].reshape(-1, 3)
+
+# Cylinder mesh resolution along the height and across the caps. The wall
+# is straight along z, so its bottom and top rings describe it exactly.
+_Z_SAMPLES = 2
+_CAP_R_SAMPLES = 20
+
+# Unit height and cap radius samples, shared by every resolution
+_Z_UNIT = np.linspace(0, 1, _Z_SAMPLES)
+_Z_UNIT.flags.writeable = False
+_CAP_R_UNIT = np.linspace(0, 1, _CAP_R_SAMPLES)
+_CAP_R_UNIT.flags.writeable = False
+
+
+@lru_cache(maxsize=32)
+def _cylinder_unit_mesh(n_theta: int) -> Tuple[np.ndarray, ...]:
+    """
+    Precompute the unit-radius, unit-height cylinder grids for n_theta samples.
+    
+    The trig tables don't depend on the dimensions, so plot_cylinder_3d only
+    has to scale these by radius and height. Arrays are float32, which is
+    plenty for screen display and halves the figure payload, and read-only
+    because they are shared between calls.
+    
+    Returns:
+        Tuple of (wall_cos, wall_sin, wall_z, cap_cos, cap_sin, cap_zero)
+    """
+    # One theta table serves both the wall and the caps
+    theta = np.linspace(0, 2*np.pi, n_theta)
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    
+    # Wall grids, shape (_Z_SAMPLES, n_theta)
+    wall_shape = (_Z_SAMPLES, n_theta)
+    wall_cos = np.broadcast_to(cos_t, wall_shape).copy()
+    wall_sin = np.broadcast_to(sin_t, wall_shape).copy()
+    wall_z = np.broadcast_to(_Z_UNIT[:, None], wall_shape).copy()
+    
+    # Cap grids, shape (n_theta, _CAP_R_SAMPLES)
+    cap_cos = np.outer(cos_t, _CAP_R_UNIT)
+    cap_sin = np.outer(sin_t, _CAP_R_UNIT)
+    cap_zero = np.zeros_like(cap_cos)
+    
+    arrays = tuple(arr.astype(np.float32)
+                   for arr in (wall_cos, wall_sin, wall_z, cap_cos, cap_sin, cap_zero))
+    for arr in arrays:
+        arr.flags.writeable = False
+    return arrays
 
 
 def plot_cylinder_3d(radius: float, height: float, closed: bool = True, 
-                     title: str = "Optimized Cylinder") -> go.Figure:
+                     title: str = "Optimized Cylinder", n_theta: int = 100) -> "go.Figure":
     """
     Create an interactive 3D visualization of a cylinder.
     
@@ -21,42 +158,41 @@ def plot_cylinder_3d(radius: float, height: float, closed: bool = True,
         height: Cylinder height
         closed: Whether cylinder has top and bottom caps
         title: Plot title
+        n_theta: Number of angular samples; the figure payload scales with it
         
     Returns:
         Plotly figure object
     """
-    # Generate cylinder surface
-    theta = np.linspace(0, 2*np.pi, 100)
-    z = np.linspace(0, height, 50)
-    theta_grid, z_grid = np.meshgrid(theta, z)
+    go = _lazy_go()
     
-    x_grid = radius * np.cos(theta_grid)
-    y_grid = radius * np.sin(theta_grid)
+    wall_cos, wall_sin, wall_z, cap_cos, cap_sin, cap_zero = _cylinder_unit_mesh(n_theta)
     
-    # Create figure
-    fig = go.Figure()
+    # Scale factors as float32 so the scaled grids stay float32
+    radius32 = np.float32(radius)
+    height32 = np.float32(height)
+    
+    # Generate cylinder surface
+    x_grid = radius32 * wall_cos
+    y_grid = radius32 * wall_sin
+    z_grid = height32 * wall_z
     
-    # Add cylinder surface
-    fig.add_trace(go.Surface(
+    # Cylinder surface
+    traces = [go.Surface(
         x=x_grid, y=y_grid, z=z_grid,
         colorscale='Blues',
         showscale=False,
         name='Cylinder Surface',
         opacity=0.8
-    ))
+    )]
     
-    # Add top and bottom caps if closed
+    # Top and bottom caps if closed
     if closed:
-        r = np.linspace(0, radius, 20)
-        theta_cap = np.linspace(0, 2*np.pi, 100)
-        r_grid, theta_cap_grid = np.meshgrid(r, theta_cap)
-        
-        x_cap = r_grid * np.cos(theta_cap_grid)
-        y_cap = r_grid * np.sin(theta_cap_grid)
+        x_cap = radius32 * cap_cos
+        y_cap = radius32 * cap_sin
         
         # Bottom cap
-        fig.add_trace(go.Surface(
-            x=x_cap, y=y_cap, z=np.zeros_like(x_cap),
+        traces.append(go.Surface(
+            x=x_cap, y=y_cap, z=cap_zero,
             colorscale='Blues',
             showscale=False,
             name='Bottom',
@@ -64,16 +200,16 @@ def plot_cylinder_3d(radius: float, height: float, closed: bool = True,
         ))
         
         # Top cap
-        fig.add_trace(go.Surface(
-            x=x_cap, y=y_cap, z=np.ones_like(x_cap) * height,
+        traces.append(go.Surface(
+            x=x_cap, y=y_cap, z=np.full_like(cap_zero, height32),
             colorscale='Blues',
             showscale=False,
             name='Top',
             opacity=0.8
         ))
     
-    # Update layout
-    fig.update_layout(
+    # Create figure with all traces and the layout in one pass
+    fig = go.Figure(data=traces, layout=dict(
         title=title,
         scene=dict(
             xaxis_title='X',
@@ -86,18 +222,13 @@ def plot_cylinder_3d(radius: float, height: float, closed: bool = True,
         ),
         width=700,
         height=700
-    )
-    
-    # Hide mode bar to remove all buttons
-    config = {
-        'displayModeBar': False
-    }
+    ))
     
-    return fig, config
+    return fig, dict(_PLOTLY_CONFIG)
 
 
 def plot_box_3d(length: float, width: float, height: float, 
-                open_top: bool = True, title: str = "Optimized Box") -> go.Figure:
+                open_top: bool = True, title: str = "Optimized Box") -> "go.Figure":
     """
     Create an interactive 3D visualization of a rectangular box.
     
@@ -111,52 +242,47 @@ def plot_box_3d(length: float, width: float, height: float,
     Returns:
         Plotly figure object
     """
+    go = _lazy_go()
+    
     # Define vertices
     vertices = np.array([
         [0, 0, 0], [length, 0, 0], [length, width, 0], [0, width, 0],  # bottom
         [0, 0, height], [length, 0, height], [length, width, height], [0, width, height]  # top
-    ])
-    
-    # Define faces
-    faces = [
-        [0, 1, 2, 3],  # bottom
-        [0, 1, 5, 4],  # front
-        [1, 2, 6, 5],  # right
-        [2, 3, 7, 6],  # back
-        [3, 0, 4, 7],  # left
-    ]
-    
-    if not open_top:
-        faces.append([4, 5, 6, 7])  # top
-    
-    fig = go.Figure()
+    ], dtype=float)
+    
+    # Gather the vertices of every face at once, shape (n_faces, 4, 3)
+    n_faces = 5 if open_top else 6
+    face_verts = vertices[_BOX_FACE_IDX[:n_faces]]
+    
+    # All faces as one mesh over the 8 vertices
+    tris = _BOX_TRIS[:2 * n_faces]
+    faces = go.Mesh3d(
+        x=vertices[:, 0],
+        y=vertices[:, 1],
+        z=vertices[:, 2],
+        i=tris[:, 0],
+        j=tris[:, 1],
+        k=tris[:, 2],
+        opacity=0.7,
+        color='lightblue',
+        flatshading=True
+    )
     
-    # Add each face
-    for i, face in enumerate(faces):
-        face_vertices = vertices[face]
-        x = list(face_vertices[:, 0]) + [face_vertices[0, 0]]
-        y = list(face_vertices[:, 1]) + [face_vertices[0, 1]]
-        z = list(face_vertices[:, 2]) + [face_vertices[0, 2]]
-        
-        fig.add_trace(go.Mesh3d(
-            x=face_vertices[:, 0],
-            y=face_vertices[:, 1],
-            z=face_vertices[:, 2],
-            opacity=0.7,
-            color='lightblue',
-            flatshading=True
-        ))
-        
-        # Add edges
-        fig.add_trace(go.Scatter3d(
-            x=x, y=y, z=z,
-            mode='lines',
-            line=dict(color='darkblue', width=4),
-            showlegend=False
-        ))
+    # All edges as one trace: each face loop is closed back to its first
+    # vertex and followed by a NaN so the line breaks between faces
+    loops = face_verts[:, _CLOSE_IDX]
+    gap = np.full((n_faces, 1, 3), np.nan)
+    points = np.concatenate([loops, gap], axis=1).reshape(-1, 3)
+    outline = go.Scatter3d(
+        x=points[:, 0], y=points[:, 1], z=points[:, 2],
+        mode='lines',
+        line=dict(color='darkblue', width=4),
+        connectgaps=False,
+        showlegend=False
+    )
     
-    # Update layout
-    fig.update_layout(
+    # Create figure with all traces and the layout in one pass
+    fig = go.Figure(data=[faces, outline], layout=dict(
         title=title,
         scene=dict(
             xaxis_title='Length',
@@ -169,19 +295,56 @@ def plot_box_3d(length: float, width: float, height: float,
         ),
         width=700,
         height=700
-    )
+    ))
     
-    # Hide mode bar to remove all buttons
-    config = {
-        'displayModeBar': False
-    }
+    return fig, dict(_PLOTLY_CONFIG)
+
+
+@lru_cache(maxsize=128)
+def _cyl_landscape_arrays(volume: float, closed: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sweep radius and calculate surface areas in one compiled loop.
+    
+    Cached per (volume, closed); the arrays are float32 to halve the figure
+    payload and read-only because they are shared between calls.
     
-    return fig, config
+    Returns:
+        Tuple of (r_range, surface_areas)
+    """
+    r_range = np.empty(_SWEEP_POINTS, dtype=np.float32)
+    surface_areas = np.empty(_SWEEP_POINTS, dtype=np.float32)
+    cyl_sa_sweep, _ = _lazy_kernels()
+    cyl_sa_sweep(r_range, surface_areas, volume, closed)
+    r_range.flags.writeable = False
+    surface_areas.flags.writeable = False
+    return r_range, surface_areas
+
+
+@lru_cache(maxsize=128)
+def _box_landscape_arrays(volume: float, open_top: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sweep square-base side length and calculate surface areas in one
+    compiled loop.
+    
+    Cached per (volume, open_top); the arrays are float32 to halve the
+    figure payload and read-only because they are shared between calls.
+    
+    Returns:
+        Tuple of (l_range, surface_areas)
+    """
+    l_range = np.empty(_SWEEP_POINTS, dtype=np.float32)
+    surface_areas = np.empty(_SWEEP_POINTS, dtype=np.float32)
+    _, box_sa_sweep = _lazy_kernels()
+    box_sa_sweep(l_range, surface_areas, volume, open_top)
+    l_range.flags.writeable = False
+    surface_areas.flags.writeable = False
+    return l_range, surface_areas
 
 
 def plot_optimization_landscape_cylinder(volume: float, closed: bool = True,
                                          optimal_r: Optional[float] = None,
-                                         optimal_h: Optional[float] = None) -> go.Figure:
+                                         optimal_h: Optional[float] = None,
+                                         optimal_sa: Optional[float] = None) -> "go.Figure":
     """
     Plot the optimization landscape showing how surface area varies with dimensions.
     
@@ -190,25 +353,21 @@ def plot_optimization_landscape_cylinder(volume: float, closed: bool = True,
         closed: Whether cylinder is closed
         optimal_r: Optimal radius to mark on plot
         optimal_h: Optimal height to mark on plot
+        optimal_sa: Surface area at the optimum, e.g. from the optimizer;
+            computed from optimal_r and optimal_h if not given
         
     Returns:
         Plotly figure object
     """
-    # Create grid of radius values
-    r_range = np.linspace(0.1, 3 * (volume / np.pi) ** (1/3), 100)
-    h_values = volume / (np.pi * r_range**2)
+    go = _lazy_go()
     
-    # Calculate surface areas
-    if closed:
-        surface_areas = 2 * np.pi * r_range**2 + 2 * np.pi * r_range * h_values
-    else:
-        surface_areas = np.pi * r_range**2 + 2 * np.pi * r_range * h_values
+    r_range, surface_areas = _cyl_landscape_arrays(float(volume), bool(closed))
     
     # Create figure
     fig = go.Figure()
     
-    # Add surface area curve
-    fig.add_trace(go.Scatter(
+    # Add surface area curve (WebGL-rendered)
+    fig.add_trace(go.Scattergl(
         x=r_range,
         y=surface_areas,
         mode='lines',
@@ -218,10 +377,11 @@ def plot_optimization_landscape_cylinder(volume: float, closed: bool = True,
     
     # Mark optimal point
     if optimal_r is not None:
-        if closed:
-            optimal_sa = 2 * np.pi * optimal_r**2 + 2 * np.pi * optimal_r * optimal_h
-        else:
-            optimal_sa = np.pi * optimal_r**2 + 2 * np.pi * optimal_r * optimal_h
+        if optimal_sa is None:
+            if closed:
+                optimal_sa = 2 * np.pi * optimal_r**2 + 2 * np.pi * optimal_r * optimal_h
+            else:
+                optimal_sa = np.pi * optimal_r**2 + 2 * np.pi * optimal_r * optimal_h
         
         fig.add_trace(go.Scatter(
             x=[optimal_r],
@@ -237,7 +397,8 @@ def plot_optimization_landscape_cylinder(volume: float, closed: bool = True,
         xaxis_title='Radius (r)',
         yaxis_title='Surface Area',
         hovermode='closest',
-        showlegend=True
+        showlegend=True,
+        uirevision='static'
     )
     
     return fig
@@ -245,7 +406,8 @@ def plot_optimization_landscape_cylinder(volume: float, closed: bool = True,
 
 def plot_optimization_landscape_box(volume: float, open_top: bool = True,
                                    optimal_l: Optional[float] = None,
-                                   optimal_h: Optional[float] = None) -> go.Figure:
+                                   optimal_h: Optional[float] = None,
+                                   optimal_sa: Optional[float] = None) -> "go.Figure":
     """
     Plot the optimization landscape for a square-base box.
     
@@ -254,25 +416,22 @@ def plot_optimization_landscape_box(volume: float, open_top: bool = True,
         open_top: Whether box has open top
         optimal_l: Optimal base side length to mark on plot
         optimal_h: Optimal height to mark on plot
+        optimal_sa: Surface area at the optimum, e.g. from the optimizer;
+            computed from optimal_l and optimal_h if not given
         
     Returns:
         Plotly figure object
     """
-    # Create grid of base side length values (assuming square base l = w)
-    l_range = np.linspace(0.1, 3 * volume ** (1/3), 100)
-    h_values = volume / (l_range**2)
+    go = _lazy_go()
     
-    # Calculate surface areas
-    if open_top:
-        surface_areas = l_range**2 + 4 * l_range * h_values
-    else:
-        surface_areas = 2 * l_range**2 + 4 * l_range * h_values
+    # Base side length sweep, assuming square base l = w
+    l_range, surface_areas = _box_landscape_arrays(float(volume), bool(open_top))
     
     # Create figure
     fig = go.Figure()
     
-    # Add surface area curve
-    fig.add_trace(go.Scatter(
+    # Add surface area curve (WebGL-rendered)
+    fig.add_trace(go.Scattergl(
         x=l_range,
         y=surface_areas,
         mode='lines',
@@ -282,10 +441,11 @@ def plot_optimization_landscape_box(volume: float, open_top: bool = True,
     
     # Mark optimal point
     if optimal_l is not None:
-        if open_top:
-            optimal_sa = optimal_l**2 + 4 * optimal_l * optimal_h
-        else:
-            optimal_sa = 2 * optimal_l**2 + 4 * optimal_l * optimal_h
+        if optimal_sa is None:
+            if open_top:
+                optimal_sa = optimal_l**2 + 4 * optimal_l * optimal_h
+            else:
+                optimal_sa = 2 * optimal_l**2 + 4 * optimal_l * optimal_h
         
         fig.add_trace(go.Scatter(
             x=[optimal_l],
@@ -301,13 +461,14 @@ def plot_optimization_landscape_box(volume: float, open_top: bool = True,
         xaxis_title='Base Side Length (l = w)',
         yaxis_title='Surface Area',
         hovermode='closest',
-        showlegend=True
+        showlegend=True,
+        uirevision='static'
     )
     
     return fig
 
 
-def plot_shape_comparison(results: dict, volume: float) -> go.Figure:
+def plot_shape_comparison(results: dict, volume: float) -> "go.Figure":
     """
     Create a bar chart comparing surface areas of different container shapes.
     
@@ -319,17 +480,40 @@ def plot_shape_comparison(results: dict, volume: float) -> go.Figure:
         Plotly figure object
     """
     shapes = list(results.keys())
-    surface_areas = [results[shape]['surface_area'] for shape in shapes]
+    surface_areas = np.fromiter((data['surface_area'] for data in results.values()),
+                                dtype=np.float64, count=len(shapes))
+    return plot_shape_comparison_fast(shapes, surface_areas, volume)
+
+
+def plot_shape_comparison_fast(shape_names: List[str], surface_areas: np.ndarray,
+                               volume: float) -> "go.Figure":
+    """
+    Create the surface area bar chart from pre-extracted arrays.
+    
+    Same chart as plot_shape_comparison, for callers that already hold the
+    shape names and surface areas and can skip the results dict walk.
+    
+    Args:
+        shape_names: Shape keys as used by compare_shapes (e.g. 'box_open')
+        surface_areas: Surface area of each shape, in the same order
+        volume: Volume constraint
+        
+    Returns:
+        Plotly figure object
+    """
+    go = _lazy_go()
+    
+    surface_areas = np.asarray(surface_areas, dtype=np.float64)
     
     # Format shape names for display
-    shape_labels = [shape.replace('_', ' ').title() for shape in shapes]
+    shape_labels = [shape.replace('_', ' ').title() for shape in shape_names]
     
     fig = go.Figure(data=[
         go.Bar(
             x=shape_labels,
             y=surface_areas,
             marker_color=['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728'],
-            text=[f'{sa:.2f}' for sa in surface_areas],
+            text=[f'{sa:.2f}' for sa in surface_areas.tolist()],
             textposition='auto',
         )
     ])
@@ -345,7 +529,7 @@ def plot_shape_comparison(results: dict, volume: float) -> go.Figure:
     return fig
 
 
-def plot_dimensions_comparison(results: dict) -> go.Figure:
+def plot_dimensions_comparison(results: dict) -> "go.Figure":
     """
     Create a grouped bar chart comparing dimensions of different shapes.
     
@@ -355,28 +539,18 @@ def plot_dimensions_comparison(results: dict) -> go.Figure:
     Returns:
         Plotly figure object
     """
-    shapes = list(results.keys())
-    shape_labels = [shape.replace('_', ' ').title() for shape in shapes]
+    go = _lazy_go()
     
     fig = go.Figure()
     
-    # Add bars for each dimension type
-    for i, shape in enumerate(shapes):
-        data = results[shape]
-        dims = []
-        labels = []
-        
-        if 'radius' in data:
-            dims.extend([data['radius'], data['height']])
-            labels.extend(['Radius', 'Height'])
-        else:
-            dims.extend([data['length'], data['width'], data['height']])
-            labels.extend(['Length', 'Width', 'Height'])
+    # Add bars for each dimension type, looking each shape's dict up once
+    for shape, data in results.items():
+        keys, labels = _CYLINDER_DIMS if 'radius' in data else _BOX_DIMS
         
         fig.add_trace(go.Bar(
-            name=shape_labels[i],
+            name=shape.replace('_', ' ').title(),
             x=labels,
-            y=dims,
+            y=[data[key] for key in keys],
         ))
     
     fig.update_layout(
@@ -1,5 +1,9 @@
 """Unit tests for optimization module."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 import numpy as np
 from src.optimization import (
@@ -217,6 +221,46 @@ class TestCompareShapes:
         
         # Closed box: l/h = 1 (cube)
         assert np.isclose(results['box_closed']['dimensions_ratio'], 1.0, rtol=1e-6)
+    
+    def test_matches_optimizers(self):
+        """Test that comparison results match the optimizer classes."""
+        volume = 750.0
+        results = compare_shapes(volume)
+        
+        r, h, sa = CylinderOptimizer(volume, closed=True).analytical_solution()
+        assert np.allclose([r, h, sa], [results['cylinder_closed'][k] for k in ('radius', 'height', 'surface_area')])
+        
+        r, h, sa = CylinderOptimizer(volume, closed=False).analytical_solution()
+        assert np.allclose([r, h, sa], [results['cylinder_open'][k] for k in ('radius', 'height', 'surface_area')])
+        
+        l, w, h, sa = RectangularBoxOptimizer(volume, open_top=True).analytical_solution()
+        assert np.allclose([l, w, h, sa], [results['box_open'][k] for k in ('length', 'width', 'height', 'surface_area')])
+        
+        l, w, h, sa = RectangularBoxOptimizer(volume, open_top=False).analytical_solution()
+        assert np.allclose([l, w, h, sa], [results['box_closed'][k] for k in ('length', 'width', 'height', 'surface_area')])
+    
+    def test_invalid_volume(self):
+        """Test that invalid volume raises ValueError."""
+        with pytest.raises(ValueError):
+            compare_shapes(0)
+
+
+class TestImportCost:
+    """Test that the optimization module stays cheap to import."""
+    
+    def test_no_heavy_imports(self):
+        """Test importing src.optimization loads neither Numba nor Plotly."""
+        code = (
+            "import sys, src.optimization; "
+            "print(','.join(m for m in ('numba', 'plotly', 'matplotlib') "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
 
 
 if __name__ == '__main__':
@@ -0,0 +1,135 @@
+"""Unit tests for visualization module."""
+
+import pytest
+import numpy as np
+from src._landscape_kernels import cyl_sa_sweep, box_sa_sweep
+from src.visualization import (
+    plot_box_3d,
+    plot_cylinder_3d,
+    _cylinder_unit_mesh,
+    _cyl_landscape_arrays,
+    _box_landscape_arrays
+)
+
+
+class TestLandscapeKernels:
+    """Test cases for the landscape sweep kernels."""
+
+    @pytest.mark.parametrize("closed, cap", [(True, 2 * np.pi), (False, np.pi)])
+    def test_cylinder_sweep_matches_closed_form(self, closed, cap):
+        """Test cylinder sweep against the linspace closed-form curve."""
+        volume = 1000.0
+        r_out = np.empty(100)
+        sa_out = np.empty(100)
+        cyl_sa_sweep(r_out, sa_out, volume, closed)
+
+        r_range = np.linspace(0.1, 3 * (volume / np.pi)**(1/3), 100)
+        expected_sa = cap * r_range**2 + 2 * volume / r_range
+        assert np.allclose(r_out, r_range, rtol=1e-9)
+        assert np.allclose(sa_out, expected_sa, rtol=1e-9)
+
+    @pytest.mark.parametrize("open_top, base", [(True, 1.0), (False, 2.0)])
+    def test_box_sweep_matches_closed_form(self, open_top, base):
+        """Test box sweep against the linspace closed-form curve."""
+        volume = 1000.0
+        l_out = np.empty(100)
+        sa_out = np.empty(100)
+        box_sa_sweep(l_out, sa_out, volume, open_top)
+
+        l_range = np.linspace(0.1, 3 * volume**(1/3), 100)
+        expected_sa = base * l_range**2 + 4 * volume / l_range
+        assert np.allclose(l_out, l_range, rtol=1e-9)
+        assert np.allclose(sa_out, expected_sa, rtol=1e-9)
+
+
+class TestLandscapeArrays:
+    """Test cases for the cached float32 landscape arrays."""
+
+    @pytest.mark.parametrize("closed, cap", [(True, 2 * np.pi), (False, np.pi)])
+    def test_cylinder_arrays_match_closed_form(self, closed, cap):
+        """Test float32 cylinder landscape arrays against the closed form."""
+        volume = 1000.0
+        r_range, surface_areas = _cyl_landscape_arrays(volume, closed)
+
+        expected_r = np.linspace(0.1, 3 * (volume / np.pi)**(1/3), 100)
+        expected_sa = cap * expected_r**2 + 2 * volume / expected_r
+        assert r_range.dtype == surface_areas.dtype == np.float32
+        assert not r_range.flags.writeable and not surface_areas.flags.writeable
+        assert np.allclose(r_range, expected_r, rtol=1e-5)
+        assert np.allclose(surface_areas, expected_sa, rtol=1e-5)
+
+    @pytest.mark.parametrize("open_top, base", [(True, 1.0), (False, 2.0)])
+    def test_box_arrays_match_closed_form(self, open_top, base):
+        """Test float32 box landscape arrays against the closed form."""
+        volume = 1000.0
+        l_range, surface_areas = _box_landscape_arrays(volume, open_top)
+
+        expected_l = np.linspace(0.1, 3 * volume**(1/3), 100)
+        expected_sa = base * expected_l**2 + 4 * volume / expected_l
+        assert l_range.dtype == surface_areas.dtype == np.float32
+        assert not l_range.flags.writeable and not surface_areas.flags.writeable
+        assert np.allclose(l_range, expected_l, rtol=1e-5)
+        assert np.allclose(surface_areas, expected_sa, rtol=1e-5)
+
+
+class TestPlotCylinder3D:
+    """Test cases for plot_cylinder_3d."""
+
+    def test_wall_rings(self):
+        """Test the wall is two rings of n_theta points at z = 0 and height."""
+        fig, _ = plot_cylinder_3d(2.0, 5.0, closed=False, n_theta=40)
+        wall = fig.data[0]
+        assert wall.z.shape == (2, 40)
+        assert np.all(wall.z[0] == 0)
+        assert np.allclose(wall.z[1], 5.0)
+        assert np.allclose(np.hypot(wall.x, wall.y), 2.0)
+
+    @pytest.mark.parametrize("closed, n_traces", [(True, 3), (False, 1)])
+    def test_caps_only_when_closed(self, closed, n_traces):
+        """Test bottom and top caps are added only for a closed cylinder."""
+        fig, _ = plot_cylinder_3d(2.0, 5.0, closed=closed, n_theta=40)
+        assert len(fig.data) == n_traces
+
+    def test_cap_heights(self):
+        """Test the bottom cap sits at z = 0 and the top cap at height."""
+        fig, _ = plot_cylinder_3d(2.0, 5.0, closed=True, n_theta=40)
+        bottom, top = fig.data[1], fig.data[2]
+        assert np.all(bottom.z == 0)
+        assert np.allclose(top.z, 5.0)
+        assert np.allclose(np.hypot(top.x, top.y).max(), 2.0)
+
+    def test_traces_are_float32(self):
+        """Test every trace coordinate array is float32."""
+        fig, _ = plot_cylinder_3d(2.0, 5.0, closed=True, n_theta=40)
+        for trace in fig.data:
+            for coords in (trace.x, trace.y, trace.z):
+                assert coords.dtype == np.float32
+
+    def test_unit_mesh_unchanged_by_plotting(self):
+        """Test plotting with a new radius leaves the cached unit arrays intact."""
+        before = [arr.copy() for arr in _cylinder_unit_mesh(40)]
+        plot_cylinder_3d(2.0, 5.0, closed=True, n_theta=40)
+        plot_cylinder_3d(7.0, 3.0, closed=True, n_theta=40)
+        after = _cylinder_unit_mesh(40)
+        for old, new in zip(before, after):
+            assert not new.flags.writeable
+            assert np.array_equal(old, new)
+
+
+class TestPlotBox3D:
+    """Test cases for plot_box_3d."""
+
+    @pytest.mark.parametrize("open_top, n_tris", [(True, 10), (False, 12)])
+    def test_face_triangle_count(self, open_top, n_tris):
+        """Test two triangles per face, with the top face dropped when open."""
+        fig, _ = plot_box_3d(2.0, 3.0, 4.0, open_top=open_top)
+        mesh = fig.data[0]
+        assert len(mesh.i) == len(mesh.j) == len(mesh.k) == n_tris
+
+    @pytest.mark.parametrize("open_top, n_points", [(True, 30), (False, 36)])
+    def test_outline_point_count(self, open_top, n_points):
+        """Test one closed 5-point loop plus a NaN break per face."""
+        fig, _ = plot_box_3d(2.0, 3.0, 4.0, open_top=open_top)
+        outline = fig.data[1]
+        assert len(outline.x) == n_points
+        assert np.isnan(np.asarray(outline.x, dtype=float)[5::6]).all()